@@ -0,0 +1,109 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # When running as module: python -m dependency_analyzer
+    from .parser import ImportEntry
+except ImportError:
+    # When running directly
+    from parser import ImportEntry
+
+# file path -> ((st_mtime_ns, st_size), [[module, names], ...])
+CacheEntries = Dict[str, Tuple[Tuple[int, int], List[list]]]
+
+
+def _is_import(item) -> bool:
+    return (
+        isinstance(item, list) and len(item) == 2
+        and (item[0] is None or isinstance(item[0], str))
+        and isinstance(item[1], list) and all(isinstance(n, str) for n in item[1])
+    )
+
+
+class ImportCache:
+    """Persist parsed imports between runs, keyed by file mtime and size.
+
+    The cache lives inside the analysed project, so it is stored as plain JSON:
+    loading it must never run code supplied by the tree being analysed.
+    """
+
+    DIR_NAME = ".dependency_analyzer_cache"
+    # Bump whenever the parsers change what they return for the same source
+    SCHEMA_VERSION = 3
+
+    def __init__(self, root: str, accurate: bool):
+        # Results of the line-based scan and of the AST parser are kept apart
+        name = "imports-ast.json" if accurate else "imports.json"
+        self.path = Path(root) / self.DIR_NAME / name
+        self._old: CacheEntries = self._load()
+        # Entries for the files seen in this run; deleted files drop out
+        self._new: CacheEntries = {}
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+
+    def _load(self) -> CacheEntries:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable cache: start over
+            return {}
+
+        if not isinstance(data, dict) or data.get("schema") != self.SCHEMA_VERSION:
+            return {}
+        entries = data.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+
+        loaded: CacheEntries = {}
+        for key, value in entries.items():
+            # Skip the whole file if any entry is malformed
+            if not (isinstance(value, list) and len(value) == 2):
+                return {}
+            stamp, imports = value
+            if not (isinstance(stamp, list) and len(stamp) == 2
+                    and all(type(n) is int for n in stamp)):
+                return {}
+            if not (isinstance(imports, list) and all(_is_import(i) for i in imports)):
+                return {}
+            loaded[key] = (tuple(stamp), imports)
+        return loaded
+
+    def get(self, file_path: Path) -> Optional[List[ImportEntry]]:
+        """Return the cached imports of ``file_path`` if it is unchanged."""
+        key = str(file_path)
+        st = os.stat(file_path)
+        stamp = self._stamps[key] = (st.st_mtime_ns, st.st_size)
+
+        cached = self._old.get(key)
+        if cached is None or cached[0] != stamp:
+            return None
+
+        self._new[key] = cached
+        return [ImportEntry(module, list(names)) for module, names in cached[1]]
+
+    def put(self, file_path: Path, imports: List[ImportEntry]):
+        """Record freshly parsed imports; ``get`` must have been called first."""
+        key = str(file_path)
+        self._new[key] = (self._stamps[key], [[e.module, e.names] for e in imports])
+
+    def save(self):
+        if self._new == self._old:
+            return
+
+        cache_dir = self.path.parent
+        tmp = self.path.with_suffix(".tmp")
+        try:
+            if not cache_dir.exists():
+                cache_dir.mkdir()
+                # Keep the cache out of the project's version control
+                (cache_dir / ".gitignore").write_text(
+                    "# Created by dependency_analyzer automatically.\n*\n", encoding="utf-8"
+                )
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"schema": self.SCHEMA_VERSION, "entries": self._new}, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            # A read-only project still gets analysed, just without a cache
+            pass
@@ -16,6 +16,17 @@ except ImportError:
     from runner import Analyzer
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Analyze Python file dependencies in a project and generate dependency graph."
@@ -46,6 +57,21 @@ def main():
         "--json-file",
         help="Save dependency graph as JSON to specified file"
     )
+    parser.add_argument(
+        "--accurate",
+        action="store_true",
+        help="Parse files with the AST instead of the faster line-based import scan"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse every file again instead of reusing imports cached by earlier runs"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        help="Number of processes used to parse files with --accurate (default: number of CPUs)"
+    )
     
     args = parser.parse_args()
     
@@ -61,7 +87,8 @@ def main():
     
     try:
         # Run analysis
-        analyzer = Analyzer(str(project_path), enable_visual=not args.no_visual)
+        analyzer = Analyzer(str(project_path), enable_visual=not args.no_visual, jobs=args.jobs,
+                            accurate=args.accurate, use_cache=not args.no_cache)
         result = analyzer.run()
         
         # Output JSON if requested
@@ -1,9 +1,5 @@
-import os
-
-IGNORE_DIRS = {
+IGNORE_DIRS = frozenset({
     "__pycache__", ".git", ".mypy_cache", ".pytest_cache",
-    "build", "dist", "venv", ".idea", ".vscode"
-}
-
-def should_ignore(path: str) -> bool:
-    return any(part in IGNORE_DIRS for part in path.split(os.sep))
+    "build", "dist", "venv", ".idea", ".vscode",
+    ".dependency_analyzer_cache"
+})
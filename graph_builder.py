@@ -1,12 +1,25 @@
-from collections import defaultdict
+import sys
+from itertools import groupby
+from operator import itemgetter
+from typing import List, Set, Tuple
 
 
 class DependencyGraph:
     def __init__(self):
-        self.edges = defaultdict(set)
+        # Flat edge list, sorted once in to_dict(); the set only deduplicates
+        self.edges: List[Tuple[str, str]] = []
+        self._seen: Set[Tuple[str, str]] = set()
 
     def add(self, src, dst):
-        self.edges[src].add(dst)
+        # Paths repeat across many edges; interned, equal paths share storage
+        edge = (sys.intern(src), sys.intern(dst))
+        if edge not in self._seen:
+            self._seen.add(edge)
+            self.edges.append(edge)
 
     def to_dict(self):
-        return {k: sorted(list(v)) for k, v in self.edges.items()}
+        self.edges.sort()
+        return {
+            src: [dst for _, dst in group]
+            for src, group in groupby(self.edges, key=itemgetter(0))
+        }
@@ -1,4 +1,6 @@
 import ast
+import re
+import sys
 from dataclasses import dataclass
 from typing import List
 
@@ -9,26 +11,122 @@ class ImportEntry:
     names: list[str]
 
 
+# Import statements at the start of a line. Groups: from-module and its
+# names (parenthesised or backslash-continued across lines; comments inside
+# the parentheses may contain ")"), or the names of a plain import. The
+# pattern works on bytes, so module names also take UTF-8 non-ASCII bytes.
+IMPORT_RE = re.compile(
+    rb"^[ \t]*(?:"
+    rb"from[ \t]+(\.+[\w.\x80-\xff]*|[\w.\x80-\xff]+)[ \t]+import[ \t]*(\([^)#]*(?:#[^\n]*\n[^)#]*)*\)|(?:\\\r?\n|[^\n#;\\])+)"
+    rb"|import[ \t]+((?:\\\r?\n|[^\n#;\\])+))",
+    re.MULTILINE,
+)
+
+
+COMMENT_RE = re.compile(rb"#[^\n]*")
+
+
+def _split_names(raw: bytes) -> List[str]:
+    """Split ``a as b, c.d`` (or its parenthesised form) into ``["a", "c.d"]``."""
+    # Comments only survive inside a parenthesised, multi-line name list
+    text = COMMENT_RE.sub(b"", raw).decode("utf-8", "replace")
+    names = []
+    for part in text.strip().strip("()").split(","):
+        # First word only drops "as" aliases; backslashes are line continuations
+        fields = part.replace("\\", " ").split()
+        if fields:
+            names.append(sys.intern(fields[0]))
+    return names
+
+
+class _ImportVisitor(ast.NodeVisitor):
+    """Collect imports by visiting statements only.
+
+    Imports are statements, so only statement blocks (module, function and
+    class bodies, if/for/while/try/with/match branches) are descended into;
+    expression subtrees are never visited.
+    """
+
+    # Fields that hold nested statement blocks (or handlers/cases wrapping them)
+    BLOCK_FIELDS = ("body", "orelse", "handlers", "finalbody", "cases")
+
+    def __init__(self):
+        self.results: List[ImportEntry] = []
+        self._dispatch = {
+            ast.Import: self._visit_import,
+            ast.ImportFrom: self._visit_importfrom,
+        }
+
+    def visit(self, node: ast.AST):
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
+
+    def generic_visit(self, node: ast.AST):
+        for field in self.BLOCK_FIELDS:
+            block = getattr(node, field, None)
+            if isinstance(block, list):
+                for child in block:
+                    self.visit(child)
+
+    def _visit_import(self, node: ast.Import):
+        self.results.append(
+            ImportEntry(None, [alias.name for alias in node.names])
+        )
+
+    def _visit_importfrom(self, node: ast.ImportFrom):
+        base = ("." * node.level) + (node.module or "")
+        self.results.append(
+            ImportEntry(base, [alias.name for alias in node.names])
+        )
+
+
 class ImportParser:
-    """Parse Python imports using AST."""
+    """Parse Python imports from source files.
 
-    def parse(self, file_path: str) -> List[ImportEntry]:
-        with open(file_path, "r", encoding="utf-8") as f:
-            tree = ast.parse(f.read())
+    By default imports are read with a line-based regular expression, which is
+    much faster than building an AST but also matches import lines inside
+    string literals and misses imports that do not start a line (for example
+    ``if x: import y``, or ``import b`` in ``import a; import b``).
+    ``accurate=True`` parses every file with ``ast``.
+    """
 
-        results = []
+    def __init__(self, accurate: bool = False):
+        self.accurate = accurate
 
-        for node in ast.walk(tree):
+    def parse(self, file_path: str) -> List[ImportEntry]:
+        if self.accurate:
+            return self._parse_ast(file_path)
 
-            if isinstance(node, ast.Import):
-                results.append(
-                    ImportEntry(None, [alias.name for alias in node.names])
-                )
+        with open(file_path, "rb") as f:
+            source = f.read()
 
-            elif isinstance(node, ast.ImportFrom):
-                base = ("." * node.level) + (node.module or "")
+        results = []
+        for match in IMPORT_RE.finditer(source):
+            from_module, from_names, import_names = match.groups()
+            if from_module is None:
+                results.append(ImportEntry(None, _split_names(import_names)))
+            else:
                 results.append(
-                    ImportEntry(base, [alias.name for alias in node.names])
+                    ImportEntry(sys.intern(from_module.decode("utf-8", "replace")), _split_names(from_names))
                 )
-
         return results
+
+    def _parse_ast(self, file_path: str) -> List[ImportEntry]:
+        # Hand the raw bytes to the parser: it decodes them itself (honouring
+        # PEP 263 coding cookies) without a separate str copy of the source.
+        with open(file_path, "rb") as f:
+            source = f.read()
+
+        # Every import statement spells out the keyword, so a file without it
+        # has nothing to find and its tree need not be built at all
+        if b"import" not in source:
+            return []
+
+        tree = ast.parse(source, filename=str(file_path))
+
+        visitor = _ImportVisitor()
+        visitor.visit(tree)
+        return visitor.results
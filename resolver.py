@@ -1,32 +1,52 @@
-import os
-from typing import Optional
+import sys
+from typing import Dict, Optional, Tuple
 
 try:
     # When running as module: python -m dependency_analyzer
-    from .config import should_ignore
+    from .utils import ModuleIndex
 except ImportError:
     # When running directly
-    from config import should_ignore
+    from utils import ModuleIndex
+
+# Top-level names of the standard library and of modules built into the
+# interpreter; imports of these usually cannot resolve inside a project.
+_STDLIB = frozenset(sys.stdlib_module_names) | frozenset(sys.builtin_module_names)
 
 
 class ModuleResolver:
     """Resolve Python import paths to real file paths."""
 
+    def __init__(self, root: str, index: ModuleIndex):
+        # Project root and its module index, as built by ``scan_and_index``
+        self.root = root
+        self.index = index
+        # (module, search_dir) -> resolved path, including None for misses
+        self._cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # Stdlib names the project does not shadow with a module of its own:
+        # nothing starting with one of these can be found in the index
+        project_tops = {module_path.split("/", 1)[0] for module_path in index}
+        self._stdlib = _STDLIB - project_tops
+
     def resolve(self, module: str, search_dir: str) -> Optional[str]:
-        if not module:
+        if not module or module.split(".", 1)[0] in self._stdlib:
             return None
 
-        module_path = module.replace(".", "/")
+        key = (module, search_dir)
+        if key not in self._cache:
+            self._cache[key] = self._resolve(module, search_dir)
+        return self._cache[key]
 
-        candidates = [f"{module_path}.py", f"{module_path}/__init__.py"]
+    def _resolve(self, module: str, search_dir: str) -> Optional[str]:
+        matches = self.index.get(module.replace(".", "/"), [])
 
-        for root, _, _ in os.walk(search_dir):
-            if should_ignore(root):
-                continue
+        if search_dir == self.root:
+            return matches[0][1] if matches else None
 
-            for c in candidates:
-                full = os.path.join(root, c)
-                if os.path.exists(full):
-                    return os.path.abspath(full)
+        # search_dir is a subdirectory of the project (relative imports);
+        # it and the indexed directories are both POSIX paths
+        prefix = search_dir.rstrip("/") + "/"
+        for match_dir, full in matches:
+            if match_dir == search_dir or match_dir.startswith(prefix):
+                return full
 
-        return None
\ No newline at end of file
+        return None
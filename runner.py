@@ -1,3 +1,5 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -6,40 +8,104 @@ try:
     from .resolver import ModuleResolver
     from .graph_builder import DependencyGraph
     from .visualizer import G6Visualizer
-    from .utils import scan_py_files
+    from .utils import scan_and_index
+    from .cache import ImportCache
 except ImportError:
     # When running directly: python runner.py
     from parser import ImportParser
     from resolver import ModuleResolver
     from graph_builder import DependencyGraph
     from visualizer import G6Visualizer
-    from utils import scan_py_files
+    from utils import scan_and_index
+    from cache import ImportCache
+
+
+# Below this many files a worker pool costs more to start than it saves on
+# ast.parse; the line-based scan is cheaper than the pool at any size
+PARALLEL_MIN_FILES = 64
 
 
 class Analyzer:
-    def __init__(self, root: str, enable_visual=True):
+    def __init__(self, root: str, enable_visual=True, jobs: int | None = None, accurate=False,
+                 use_cache=True):
         self.root = Path(root)
-        self.parser = ImportParser()
-        self.resolver = ModuleResolver()
+        self.parser = ImportParser(accurate=accurate)
+        self.resolver: ModuleResolver | None = None
         self.graph = DependencyGraph()
         self.enable_visual = enable_visual
+        # Parser processes; None uses every CPU, 1 parses in this process
+        self.jobs = jobs
+        # Reuse imports parsed by earlier runs for files that did not change
+        self.use_cache = use_cache
 
-    def run(self):
-        py_files = scan_py_files(self.root)
+    def _parse_all(self, py_files):
+        """Return ``(file, imports)`` for every file, in order.
+
+        Unchanged files are served from the on-disk cache; only the rest are
+        parsed.
+        """
+        if not self.use_cache:
+            return list(self._parse_files(py_files))
 
+        cache = ImportCache(self.root, self.parser.accurate)
+        results = {}
+        misses = []
         for file in py_files:
-            imports = self.parser.parse(file)
+            imports = cache.get(file)
+            if imports is None:
+                misses.append(file)
+            else:
+                results[file] = imports
+
+        for file, imports in self._parse_files(misses):
+            cache.put(file, imports)
+            results[file] = imports
+
+        cache.save()
+        return [(file, results[file]) for file in py_files]
+
+    def _parse_files(self, py_files):
+        """Yield ``(file, imports)`` for every file, in order.
+
+        AST parsing is CPU-bound and holds the GIL, so large projects parsed in
+        accurate mode use a process pool; resolution and graph building stay
+        in this process.
+        """
+        jobs = self.jobs or os.cpu_count() or 1
+
+        if jobs == 1 or not self.parser.accurate or len(py_files) < PARALLEL_MIN_FILES:
+            for file in py_files:
+                yield file, self.parser.parse(file)
+            return
+
+        chunksize = max(1, len(py_files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from zip(py_files, executor.map(self.parser.parse, py_files, chunksize=chunksize))
+
+    def run(self):
+        # One walk of the project yields both the files to parse and the
+        # module index every import is resolved against.
+        py_files, index = scan_and_index(self.root)
+        root_posix = self.root.as_posix()
+        root_posix_len = len(root_posix)
+        self.resolver = ModuleResolver(root_posix, index)
+        # Resolved absolute path -> graph path, shared by every importer
+        dst_rels = {}
+
+        for file, imports in self._parse_all(py_files):
+            # Convert to relative path
+            src_rel = "." + file.as_posix()[root_posix_len:]
             for entry in imports:
                 # For 'import module_b', entry.module is None, entry.names = ['module_b']
                 # For 'from module_c import function_c', entry.module = 'module_c', entry.names = ['function_c']
                 if entry.module is None:
                     # Simple import: import module_b
                     for name in entry.names:
-                        resolved = self.resolver.resolve(name, self.root.as_posix())
+                        resolved = self.resolver.resolve(name, root_posix)
                         if resolved:
-                            # Convert to relative path
-                            src_rel = "." + file.as_posix()[len(self.root.as_posix()):]
-                            dst_rel = "." + resolved[len(self.root.as_posix()):]
+                            dst_rel = dst_rels.get(resolved)
+                            if dst_rel is None:
+                                dst_rel = dst_rels[resolved] = "." + resolved[root_posix_len:]
                             self.graph.add(src_rel, dst_rel)
                 else:
                     # From import: from module_c import ...
@@ -57,12 +123,12 @@ class Analyzer:
                         # Search from file_dir instead of project root
                         resolved = self.resolver.resolve(base_module, file_dir.as_posix())
                     else:
-                        resolved = self.resolver.resolve(module_to_resolve, self.root.as_posix())
+                        resolved = self.resolver.resolve(module_to_resolve, root_posix)
                     
                     if resolved:
-                        # Convert to relative path
-                        src_rel = "." + file.as_posix()[len(self.root.as_posix()):]
-                        dst_rel = "." + resolved[len(self.root.as_posix()):]
+                        dst_rel = dst_rels.get(resolved)
+                        if dst_rel is None:
+                            dst_rel = dst_rels[resolved] = "." + resolved[root_posix_len:]
                         self.graph.add(src_rel, dst_rel)
 
         result = self.graph.to_dict()
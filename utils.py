@@ -1,4 +1,86 @@
+import os
 from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
 
-def scan_py_files(path: str):
-    return list(Path(path).rglob("*.py"))
+try:
+    # When running as module: python -m dependency_analyzer
+    from .config import IGNORE_DIRS
+except ImportError:
+    # When running directly
+    from config import IGNORE_DIRS
+
+# module path ("pkg/sub/mod") -> [(matching directory as POSIX path, file path), ...]
+ModuleIndex = Dict[str, List[Tuple[str, str]]]
+
+
+def _iter_tree(directory: str, parts: List[str]) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """Yield ``(directory, parts, py_file_names)`` for ``directory`` and every
+    directory below it, top-down.
+
+    ``parts`` are the directory names from the scan root.  Ignored directories
+    are pruned by name while reading their parent, so they are never opened,
+    and the file type comes from the directory entry without an extra stat.
+    Packages (directories with an ``__init__.py``) are never pruned, so a
+    nested package that happens to be called ``build`` or ``dist`` stays
+    importable.
+    """
+    py_names = []
+    subdirs = []
+
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if (entry.name not in IGNORE_DIRS
+                            or os.path.isfile(os.path.join(entry.path, "__init__.py"))):
+                        subdirs.append(entry)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    py_names.append(entry.name)
+    except OSError:
+        # Unreadable directory: skip it, as os.walk does without onerror
+        return
+
+    yield directory, parts, py_names
+
+    for entry in subdirs:
+        yield from _iter_tree(entry.path, parts + [entry.name])
+
+
+def scan_and_index(path: str) -> Tuple[List[Path], ModuleIndex]:
+    """Walk ``path`` once, returning its .py files and a module index.
+
+    A module path may resolve from any directory of the tree, so every file
+    is indexed under its path relative to each of its ancestor directories.
+    Matches for a module path are ordered by the walk order of the directory
+    they resolve from, ``mod.py`` before ``mod/__init__.py``.
+    """
+    py_files: List[Path] = []
+    entries = []
+    # (walk order, POSIX path) of every directory seen so far, keyed by its parts
+    seen: Dict[Tuple[str, ...], Tuple[int, str]] = {}
+
+    for order, (directory, parts, py_names) in enumerate(_iter_tree(os.fspath(path), [])):
+        seen[tuple(parts)] = (order, Path(directory).as_posix())
+        ancestors = [seen[tuple(parts[:i])] for i in range(len(parts) + 1)]
+
+        for name in py_names:
+            file_path = os.path.join(directory, name)
+            py_files.append(Path(file_path))
+
+            full = os.path.abspath(file_path)
+            if name == "__init__.py":
+                module_parts, kind = parts, 1
+            else:
+                module_parts, kind = parts + [name[:-3]], 0
+
+            for i in range(len(module_parts)):
+                dir_order, match_dir = ancestors[i]
+                entries.append(
+                    (dir_order, kind, "/".join(module_parts[i:]), match_dir, full)
+                )
+
+    index: ModuleIndex = {}
+    for _, _, module_path, match_dir, full in sorted(entries, key=lambda e: e[:2]):
+        index.setdefault(module_path, []).append((match_dir, full))
+
+    return py_files, index
@@ -1,7 +1,7 @@
 import json
 import os
-from pathlib import Path
-from typing import Dict, List, Set, Tuple, DefaultDict
+import sys
+from typing import Dict, Iterator, List, Set, Tuple, DefaultDict
 from collections import defaultdict
 
 
@@ -95,27 +95,24 @@ graph.on('afterrender', (e) => {
 </body>
 </html>"""
 
-    def _extract_dirs(self, path: str) -> List[str]:
-        """Extract all parent directories from a file path."""
-        dirs = []
+    # Template halves around the data placeholder, encoded once for export()
+    TEMPLATE_HEAD, TEMPLATE_TAIL = (part.encode("utf-8") for part in TEMPLATE.split("__DATA__"))
+
+    def _extract_dirs(self, path: str) -> Iterator[str]:
+        """Yield the parent directories of a file path, nearest first."""
         # Handle relative paths starting with ./
         if path.startswith("./"):
             path = path[2:]
+        # Prepend ./ for relative paths
+        prefix = "" if path.startswith("/") else "./"
         
-        path = path.rstrip(os.sep)
-        while True:
-            path = os.path.dirname(path)
-            if not path or path == os.sep or path == ".":
+        path = path.rstrip("/")
+        while "/" in path:
+            path = path.rsplit("/", 1)[0]
+            if not path:
                 break
-            # Prepend ./ for relative paths
-            if not path.startswith("/"):
-                path = "./" + path
-            dirs.append(path)
-            # Remove ./ for next iteration
-            if path.startswith("./"):
-                path = path[2:]
-        return dirs
-
+            yield prefix + path
+    
     def _calculate_positions(self, nodes: List[Dict], combos: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
         """Calculate initial positions for nodes and combos based on directory hierarchy.
         
@@ -159,30 +156,23 @@ graph.on('afterrender', (e) => {
             # Sort combos at this depth for consistent ordering
             depth_combos.sort(key=lambda c: c["id"])
             
+            # Horizontal position based on depth, shared by the whole column
+            x = CENTER_X + (depth - 1) * DEPTH_SPACING
+            # Vertical position based on sibling order
+            # Center combos vertically at each depth
+            start_y = CENTER_Y - (len(depth_combos) - 1) * COMBO_SPACING / 2
+            
             for i, combo in enumerate(depth_combos):
-                # Horizontal position based on depth
-                x = CENTER_X + (depth - 1) * DEPTH_SPACING
-                
-                # Vertical position based on sibling order
-                # Center combos vertically at each depth
-                total_at_depth = len(depth_combos)
-                start_y = CENTER_Y - (total_at_depth - 1) * COMBO_SPACING / 2
-                y = start_y + i * COMBO_SPACING
-                
                 # Store position in style attribute
-                if "style" not in combo:
-                    combo["style"] = {}
-                combo["style"]["x"] = x
-                combo["style"]["y"] = y
+                style = combo.setdefault("style", {})
+                style["x"] = x
+                style["y"] = start_y + i * COMBO_SPACING
         
         # Calculate positions for nodes within their combos
+        combo_by_id = {combo["id"]: combo for combo in combos}
         for combo_id, combo_nodes in nodes_by_combo.items():
             # Find the combo to get its position
-            parent_combo = None
-            for combo in combos:
-                if combo["id"] == combo_id:
-                    parent_combo = combo
-                    break
+            parent_combo = combo_by_id.get(combo_id)
             
             if not parent_combo:
                 continue
@@ -203,48 +193,29 @@ graph.on('afterrender', (e) => {
                 # Distribute nodes vertically within combo
                 node_y_offset = -(total_nodes - 1) * NODE_SPACING / 2
             
+            start_y = combo_y + node_y_offset
             for i, node in enumerate(combo_nodes):
-                node_x = combo_x
-                node_y = combo_y + node_y_offset + i * NODE_SPACING
-                
                 # Store position in style attribute
-                if "style" not in node:
-                    node["style"] = {}
-                node["style"]["x"] = node_x
-                node["style"]["y"] = node_y
+                style = node.setdefault("style", {})
+                style["x"] = combo_x
+                style["y"] = start_y + i * NODE_SPACING
         
         # Calculate bounding box to center the entire graph
-        all_elements = nodes + combos
-        if all_elements:
-            # Find min and max coordinates from style attributes
-            xs = []
-            ys = []
-            for e in all_elements:
-                style = e.get("style", {})
-                if "x" in style:
-                    xs.append(style["x"])
-                if "y" in style:
-                    ys.append(style["y"])
+        # Positions are always assigned as an x/y pair, so one pass over the
+        # positioned styles gives both axes
+        styles = [e["style"] for e in nodes + combos if "x" in e.get("style", {})]
+        if styles:
+            xs = [style["x"] for style in styles]
+            ys = [style["y"] for style in styles]
             
-            if xs and ys:
-                min_x, max_x = min(xs), max(xs)
-                min_y, max_y = min(ys), max(ys)
-                
-                # Calculate center of current graph
-                graph_center_x = (min_x + max_x) / 2
-                graph_center_y = (min_y + max_y) / 2
-                
-                # Calculate translation to center in viewport
-                translate_x = CENTER_X - graph_center_x
-                translate_y = CENTER_Y - graph_center_y
-                
-                # Apply translation to all elements' style attributes
-                for element in all_elements:
-                    style = element.get("style", {})
-                    if "x" in style:
-                        style["x"] += translate_x
-                    if "y" in style:
-                        style["y"] += translate_y
+            # Translation from the current graph center to the viewport center
+            translate_x = CENTER_X - (min(xs) + max(xs)) / 2
+            translate_y = CENTER_Y - (min(ys) + max(ys)) / 2
+            
+            # Apply translation to all elements' style attributes
+            for style in styles:
+                style["x"] += translate_x
+                style["y"] += translate_y
         
         # Remove temporary depth attribute from combos
         for combo in combos:
@@ -269,41 +240,43 @@ graph.on('afterrender', (e) => {
                     "id": f"{src}->{t}"
                 })
         
-        # Create nodes with combo assignment
+        # Create nodes with combo assignment, collecting the directories
+        # for combos in the same pass
         nodes = []
+        dir_set: Set[str] = set()
+        # Add root directory
+        dir_set.add(".")
         for node in sorted(node_set):
             # Get display name (basename)
-            display_name = os.path.basename(node)
-            if not display_name:
-                display_name = node
+            display_name = node.rsplit("/", 1)[-1] or node
             
             node_data = {
                 "id": node,
                 "text": display_name,
             }
+            # The nearest directory is the node's combo; once a directory is
+            # already known, so are all of its parents
+            parent_dir = None
+            for dir_path in self._extract_dirs(node):
+                if parent_dir is None:
+                    # Shared by every node of the directory and its combo
+                    parent_dir = sys.intern(dir_path)
+                if dir_path in dir_set:
+                    break
+                dir_set.add(sys.intern(dir_path))
+            
             # Assign combo based on parent directory
-            parent_dir = os.path.dirname(node)
-            if parent_dir == ".":
+            if parent_dir:
+                node_data["combo"] = parent_dir
+            elif node.startswith("./"):
                 # Root directory files belong to root combo
                 node_data["combo"] = "."
-            elif parent_dir:
-                # Ensure parent_dir has ./ prefix if it's a relative path
-                if not parent_dir.startswith("/") and not parent_dir.startswith("./"):
-                    parent_dir = "./" + parent_dir
-                node_data["combo"] = parent_dir
             nodes.append(node_data)
         
-        # Create combos for all directories
-        dir_set: Set[str] = set()
-        # Add root directory
-        dir_set.add(".")
-        for node in node_set:
-            dir_set.update(self._extract_dirs(node))
-        
         combos = []
         for dir_path in sorted(dir_set, key=len):
             # Get display name
-            display_name = os.path.basename(dir_path)
+            parent_dir, _, display_name = dir_path.rpartition("/")
             if not display_name or display_name == ".":
                 display_name = "root"
             
@@ -312,13 +285,8 @@ graph.on('afterrender', (e) => {
                 "text": display_name,
             }
             # Assign parent combo if not root
-            parent_dir = os.path.dirname(dir_path)
-            if parent_dir and parent_dir != ".":
-                # Ensure parent_dir has ./ prefix if it's a relative path
-                if not parent_dir.startswith("/") and not parent_dir.startswith("./"):
-                    parent_dir = "./" + parent_dir
-                if parent_dir in dir_set:
-                    combo_data["combo"] = parent_dir
+            if parent_dir and parent_dir != "." and parent_dir in dir_set:
+                combo_data["combo"] = parent_dir
             combos.append(combo_data)
         
         # Calculate initial positions for nodes and combos
@@ -332,8 +300,13 @@ graph.on('afterrender', (e) => {
 
     def export(self, graph_dict: Dict[str, List[str]], out: str):
         """Export dependency graph to HTML file."""
-        data = json.dumps(self.build_graph(graph_dict), indent=2)
-        html = self.TEMPLATE.replace("__DATA__", data)
-        Path(out).write_text(html, encoding="utf-8")
+        # No indent: only the compact form is encoded by the C accelerator
+        data = json.dumps(self.build_graph(graph_dict), separators=(",", ":"))
+        # Write around the placeholder instead of building a second full copy;
+        # the dump is escaped to ASCII, so encoding it is a plain copy
+        with open(out, "wb") as f:
+            f.write(self.TEMPLATE_HEAD)
+            f.write(data.encode("ascii"))
+            f.write(self.TEMPLATE_TAIL)
         print(f"[✔] Exported dependency visualization with combo support → {out}")
         return out
\ No newline at end of file